@@ -1,11 +1,13 @@
 """Async HTTP client for Folk API."""
 
+import json
 import os
 from datetime import UTC
-from typing import Any
+from typing import Any, TypeVar
 
 import aiohttp
 from aiohttp import ClientError
+from pydantic import BaseModel, ValidationError
 
 from .api_models import (
     Company,
@@ -31,6 +33,8 @@ from .api_models import (
     UserResponse,
 )
 
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
 
 class FolkAPIError(Exception):
     """Exception raised for Folk API errors."""
@@ -46,16 +50,21 @@ class FolkClient:
     """Async client for Folk API."""
 
     BASE_URL = "https://api.folk.app/v1"
+    MAX_CONNECTIONS = 100
+    MAX_CONNECTIONS_PER_HOST = 30
+    KEEPALIVE_TIMEOUT = 75.0
 
     def __init__(
         self,
         api_key: str | None = None,
         timeout: float = 30.0,
+        base_url: str | None = None,
     ) -> None:
         self.api_key = api_key or os.environ.get("FOLK_API_KEY")
         if not self.api_key:
             raise ValueError("FOLK_API_KEY is required")
         self.timeout = timeout
+        self.base_url = base_url or self.BASE_URL
         self._session: aiohttp.ClientSession | None = None
 
     async def __aenter__(self) -> "FolkClient":
@@ -67,15 +76,25 @@ class FolkClient:
 
     async def _ensure_session(self) -> None:
         if not self._session:
+            # No default Content-Type: aiohttp sets it for JSON bodies, and Folk rejects
+            # body-less DELETEs that carry one ("Body cannot be empty when content-type is set").
+            # Keeping it off the session lets every request share one connection pool.
             headers = {
                 "User-Agent": "mcp-server-folk/0.1.0",
                 "Accept": "application/json",
-                "Content-Type": "application/json",
                 "Authorization": f"Bearer {self.api_key}",
             }
 
+            # Pooled keep-alive connections so concurrent calls reuse sockets
+            connector = aiohttp.TCPConnector(
+                limit=self.MAX_CONNECTIONS,
+                limit_per_host=self.MAX_CONNECTIONS_PER_HOST,
+                keepalive_timeout=self.KEEPALIVE_TIMEOUT,
+            )
             self._session = aiohttp.ClientSession(
-                headers=headers, timeout=aiohttp.ClientTimeout(total=self.timeout)
+                headers=headers,
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
             )
 
     async def close(self) -> None:
@@ -92,9 +111,44 @@ class FolkClient:
         json_data: Any | None = None,
     ) -> dict[str, Any]:
         """Make an HTTP request to the Folk API."""
+        status, body = await self._request_raw(method, path, params=params, json_data=json_data)
+        # DELETE might return 204 No Content with empty body
+        if not body:
+            return {}
+        try:
+            return json.loads(body)  # type: ignore[no-any-return]
+        except ValueError as e:
+            raise FolkAPIError(status, "Invalid JSON response") from e
+
+    async def _request_model(
+        self,
+        model: type[ModelT],
+        method: str,
+        path: str,
+        params: dict[str, Any] | None = None,
+    ) -> ModelT:
+        """Make an HTTP request to the Folk API and validate the body as model.
+
+        The raw body goes straight to Pydantic's model_validate_json, which parses
+        and validates in one pass instead of building an intermediate dict.
+        """
+        status, body = await self._request_raw(method, path, params=params)
+        try:
+            return model.model_validate_json(body)
+        except (ValueError, ValidationError) as e:
+            raise FolkAPIError(status, "Invalid JSON response") from e
+
+    async def _request_raw(
+        self,
+        method: str,
+        path: str,
+        params: dict[str, Any] | None = None,
+        json_data: Any | None = None,
+    ) -> tuple[int, bytes]:
+        """Make an HTTP request to the Folk API and return the status and undecoded body."""
         await self._ensure_session()
 
-        url = f"{self.BASE_URL}{path}"
+        url = f"{self.base_url}{path}"
 
         # Clean up params (remove None values)
         if params:
@@ -110,43 +164,18 @@ class FolkClient:
             if params:
                 kwargs["params"] = params
 
-            # For DELETE requests without body, use a separate session request without
-            # Content-Type to avoid "Body cannot be empty when content-type is set" error
-            if method == "DELETE" and json_data is None:
-                # Create headers without Content-Type for DELETE
-                delete_headers = {
-                    "User-Agent": "mcp-server-folk/0.1.0",
-                    "Accept": "application/json",
-                    "Authorization": f"Bearer {self.api_key}",
-                }
-                async with aiohttp.ClientSession().request(
-                    method, url, headers=delete_headers, **kwargs
-                ) as response:
-                    # DELETE might return 204 No Content with empty body
-                    if response.status == 204:
-                        return {}
-                    result = await response.json()
-
-                    if response.status >= 400:
-                        error_msg = "Unknown error"
-                        if isinstance(result, dict):
-                            if "error" in result:
-                                error_obj = result["error"]
-                                if isinstance(error_obj, dict):
-                                    error_msg = error_obj.get("message", str(error_obj))
-                                else:
-                                    error_msg = str(error_obj)
-                            elif "message" in result:
-                                error_msg = result["message"]
-
-                        raise FolkAPIError(response.status, error_msg, result)
-
-                    return result  # type: ignore[no-any-return]
-
             async with self._session.request(method, url, **kwargs) as response:
-                result = await response.json()
+                # DELETE might return 204 No Content with empty body
+                if response.status == 204:
+                    return response.status, b""
+                body = await response.read()
 
                 if response.status >= 400:
+                    try:
+                        result = json.loads(body)
+                    except ValueError:
+                        result = None
+
                     error_msg = "Unknown error"
                     if isinstance(result, dict):
                         if "error" in result:
@@ -160,7 +189,7 @@ class FolkClient:
 
                     raise FolkAPIError(response.status, error_msg, result)
 
-                return result  # type: ignore[no-any-return]
+                return response.status, body
 
         except ClientError as e:
             raise FolkAPIError(500, f"Network error: {str(e)}") from e
@@ -205,8 +234,7 @@ class FolkClient:
         if filters:
             params.update(self._serialize_filters(filters))
 
-        data = await self._request("GET", "/people", params=params)
-        response = PersonListResponse(**data)
+        response = await self._request_model(PersonListResponse, "GET", "/people", params=params)
         return response.data.items
 
     async def get_person(self, person_id: str) -> Person:
@@ -317,8 +345,9 @@ class FolkClient:
         if filters:
             params.update(self._serialize_filters(filters))
 
-        data = await self._request("GET", "/companies", params=params)
-        response = CompanyListResponse(**data)
+        response = await self._request_model(
+            CompanyListResponse, "GET", "/companies", params=params
+        )
         return response.data.items
 
     async def get_company(self, company_id: str) -> Company:
@@ -417,8 +446,7 @@ class FolkClient:
         if entity_id:
             params["entity.id"] = entity_id
 
-        data = await self._request("GET", "/notes", params=params)
-        response = NoteListResponse(**data)
+        response = await self._request_model(NoteListResponse, "GET", "/notes", params=params)
         return response.data.items
 
     async def get_note(self, note_id: str) -> Note:
@@ -483,8 +511,9 @@ class FolkClient:
         if entity_id:
             params["entity.id"] = entity_id
 
-        data = await self._request("GET", "/reminders", params=params)
-        response = ReminderListResponse(**data)
+        response = await self._request_model(
+            ReminderListResponse, "GET", "/reminders", params=params
+        )
         return response.data.items
 
     async def get_reminder(self, reminder_id: str) -> Reminder:
@@ -587,8 +616,7 @@ class FolkClient:
             "cursor": cursor,
         }
 
-        data = await self._request("GET", "/groups", params=params)
-        response = GroupListResponse(**data)
+        response = await self._request_model(GroupListResponse, "GET", "/groups", params=params)
         return response.data.items
 
     # User endpoints
@@ -604,8 +632,7 @@ class FolkClient:
             "cursor": cursor,
         }
 
-        data = await self._request("GET", "/users", params=params)
-        response = UserListResponse(**data)
+        response = await self._request_model(UserListResponse, "GET", "/users", params=params)
         return response.data.items
 
     async def get_current_user(self) -> User:
@@ -642,8 +669,9 @@ class FolkClient:
         if filters:
             params.update(self._serialize_filters(filters))
 
-        data = await self._request("GET", f"/groups/{group_id}/{object_type}", params=params)
-        response = DealListResponse(**data)
+        response = await self._request_model(
+            DealListResponse, "GET", f"/groups/{group_id}/{object_type}", params=params
+        )
         return response.data.items
 
     # Interaction endpoints
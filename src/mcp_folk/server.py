@@ -19,6 +19,7 @@ from starlette.requests import Request
 from starlette.responses import JSONResponse
 
 from mcp_folk.api_client import FolkAPIError, FolkClient
+from mcp_folk.api_models import Group
 
 # Folk ID format: prefix + UUID v4 (e.g., "per_xxxxxxxx-xxxx-xxxx-xxxx-xxxxxxxxxxxx")
 _FOLK_ID_RE = re.compile(
@@ -39,6 +40,22 @@ def _validate_folk_id(value: str, entity: str = "entity") -> None:
         )
 
 
+def _find_group(groups: list[Group], name: str) -> Group | None:
+    """Resolve a group by name: exact match first, then substring (both case-insensitive).
+
+    Lowercased names are indexed once so the exact match is a dict lookup; the
+    first group wins when several share a name.
+    """
+    target = name.lower()
+    by_name: dict[str, Group] = {}
+    for g in groups:
+        by_name.setdefault(g.name.lower(), g)
+    return by_name.get(target) or next(
+        (g for key, g in by_name.items() if target in key),
+        None,
+    )
+
+
 # Configure logging to stderr (stdout is for MCP JSON-RPC)
 logging.basicConfig(
     level=logging.INFO,
@@ -475,17 +492,7 @@ async def find_people_in_group(
 
         # Resolve group name to ID
         groups = await client.list_groups(limit=100)
-        group = next(
-            (g for g in groups if g.name.lower() == group_name.lower()),
-            None,
-        )
-
-        if not group:
-            # Try fuzzy match
-            group = next(
-                (g for g in groups if group_name.lower() in g.name.lower()),
-                None,
-            )
+        group = _find_group(groups, group_name)
 
         if not group:
             available = [g.name for g in groups[:10]]
@@ -582,17 +589,7 @@ async def find_companies_in_group(
 
         # Resolve group name to ID
         groups = await client.list_groups(limit=100)
-        group = next(
-            (g for g in groups if g.name.lower() == group_name.lower()),
-            None,
-        )
-
-        if not group:
-            # Try fuzzy match
-            group = next(
-                (g for g in groups if group_name.lower() in g.name.lower()),
-                None,
-            )
+        group = _find_group(groups, group_name)
 
         if not group:
             available = [g.name for g in groups[:10]]
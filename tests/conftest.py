@@ -0,0 +1,16 @@
+"""Shared pytest configuration."""
+
+import asyncio
+import sys
+from collections.abc import Callable, Mapping
+
+import pytest
+
+if sys.platform != "win32":
+    import uvloop
+
+    def pytest_asyncio_loop_factories(
+        config: pytest.Config, item: pytest.Item
+    ) -> Mapping[str, Callable[[], asyncio.AbstractEventLoop]]:
+        """Run async tests on uvloop, a faster drop-in replacement for the asyncio loop."""
+        return {"uvloop": uvloop.new_event_loop}
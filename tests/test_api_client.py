@@ -4,8 +4,10 @@ from datetime import UTC, datetime
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
 
-from mcp_folk.api_client import FolkClient
+from mcp_folk.api_client import FolkAPIError, FolkClient
 
 
 class TestReminderRecurrenceRule:
@@ -221,3 +223,112 @@ class TestCreateReminderIntegration:
                 assert expected_dtstart in body["recurrenceRule"], (
                     f"Failed for {trigger_time}: expected {expected_dtstart} in {body['recurrenceRule']}"
                 )
+
+
+@pytest.mark.asyncio
+class TestSession:
+    """Tests for the pooled HTTP session."""
+
+    async def test_session_uses_pooled_connector(self) -> None:
+        """Test that requests share one session with a keep-alive connection pool."""
+        async with FolkClient(api_key="test_key") as client:
+            session = client._session
+            assert session is not None
+
+            connector = session.connector
+            assert connector is not None
+            assert connector.limit == FolkClient.MAX_CONNECTIONS
+            assert connector.limit_per_host == FolkClient.MAX_CONNECTIONS_PER_HOST
+
+            # Content-Type is left to aiohttp so body-less DELETEs can share the session
+            assert "Content-Type" not in session.headers
+
+            await client._ensure_session()
+            assert client._session is session
+
+        assert client._session is None
+
+
+class TestBaseUrl:
+    """Tests for the configurable API base URL."""
+
+    def test_base_url_defaults_and_overrides(self) -> None:
+        """Test that base_url falls back to BASE_URL and can be overridden per client."""
+        assert FolkClient(api_key="test_key").base_url == FolkClient.BASE_URL
+        client = FolkClient(api_key="test_key", base_url="http://localhost:8080/v1")
+        assert client.base_url == "http://localhost:8080/v1"
+
+
+@pytest.mark.asyncio
+class TestListResponses:
+    """Tests for list endpoints validating raw JSON bodies."""
+
+    async def test_list_groups_validates_raw_body(self) -> None:
+        """Test that list_groups parses the undecoded response body into models."""
+        with patch.object(FolkClient, "_request_raw", new_callable=AsyncMock) as mock_raw:
+            mock_raw.return_value = (
+                200,
+                b'{"data": {"items": [{"id": "grp_1", "name": "Clients"}],'
+                b' "pagination": {"nextLink": null}}}',
+            )
+
+            client = FolkClient(api_key="test_key")
+            groups = await client.list_groups(limit=5)
+
+            mock_raw.assert_called_once_with("GET", "/groups", params={"limit": 5, "cursor": None})
+            assert len(groups) == 1
+            assert groups[0].id == "grp_1"
+            assert groups[0].name == "Clients"
+
+    async def test_request_decodes_raw_body(self) -> None:
+        """Test that _request decodes JSON and maps an empty (204) body to {}."""
+        with patch.object(FolkClient, "_request_raw", new_callable=AsyncMock) as mock_raw:
+            client = FolkClient(api_key="test_key")
+
+            mock_raw.return_value = (200, b'{"data": {"id": "per_1"}}')
+            assert await client._request("GET", "/people/per_1") == {"data": {"id": "per_1"}}
+
+            mock_raw.return_value = (204, b"")
+            assert await client._request("DELETE", "/people/per_1") == {}
+
+    async def test_non_json_success_body_raises_api_error(self) -> None:
+        """Test that a 2xx non-JSON body (e.g. a proxy page) raises FolkAPIError."""
+        with patch.object(FolkClient, "_request_raw", new_callable=AsyncMock) as mock_raw:
+            mock_raw.return_value = (200, b"<html>Down for maintenance</html>")
+            client = FolkClient(api_key="test_key")
+
+            with pytest.raises(FolkAPIError) as exc_info:
+                await client._request("GET", "/people/per_1")
+            assert exc_info.value.status == 200
+
+            with pytest.raises(FolkAPIError) as exc_info:
+                await client.list_groups()
+            assert exc_info.value.status == 200
+
+    async def test_unexpected_list_shape_raises_api_error(self) -> None:
+        """Test that a JSON body not matching the list response model raises FolkAPIError."""
+        with patch.object(FolkClient, "_request_raw", new_callable=AsyncMock) as mock_raw:
+            mock_raw.return_value = (200, b'{"unexpected": true}')
+            client = FolkClient(api_key="test_key")
+
+            with pytest.raises(FolkAPIError, match="Invalid JSON response"):
+                await client.list_people()
+
+    async def test_non_json_error_body_keeps_status(self) -> None:
+        """Test that a non-JSON 4xx body still raises FolkAPIError with the HTTP status."""
+
+        async def rate_limited(request: web.Request) -> web.Response:
+            return web.Response(status=429, text="Too Many Requests", content_type="text/html")
+
+        app = web.Application()
+        app.router.add_get("/v1/groups", rate_limited)
+
+        async with TestServer(app) as server:
+            base_url = str(server.make_url("/v1"))
+            async with FolkClient(api_key="test_key", base_url=base_url) as client:
+                with pytest.raises(FolkAPIError) as exc_info:
+                    await client.list_groups()
+
+        assert exc_info.value.status == 429
+        assert exc_info.value.message == "Unknown error"
+        assert exc_info.value.details is None
@@ -1,235 +1,483 @@
 """Integration tests for Folk API.
 
-These tests require a valid FOLK_API_KEY environment variable.
-They are skipped if the API key is not set.
-
-Run with: FOLK_API_KEY=your_key uv run pytest tests/test_integration.py -v
+Every test runs against two backends, selectable with -m:
+
+- integration_live: HTTP interactions are recorded to YAML cassettes under
+  tests/cassettes/ with pytest-recording (VCR.py) and replayed from disk on
+  later runs, so no network or API key is needed once cassettes exist. Skipped
+  if neither a FOLK_API_KEY nor recorded cassettes are available. Cassettes
+  contain real workspace data, so they are gitignored and stay local.
+- integration_mocked: the Folk API is stubbed by an in-process aiohttp test
+  server, so these always run, offline and without an API key.
+
+Mocked only: uv run pytest tests/test_integration.py -m integration_mocked
+Replay recorded cassettes: uv run pytest tests/test_integration.py -m integration_live
+Record missing cassettes: FOLK_API_KEY=your_key uv run pytest tests/test_integration.py -v
+Refresh all cassettes: FOLK_API_KEY=your_key uv run pytest tests/test_integration.py --record-mode=all
+Run across worker processes: uv run pytest -n 4 --dist=loadfile tests/
+Show diagnostics: uv run pytest tests/test_integration.py --log-cli-level=DEBUG
 """
 
+import asyncio
+import contextlib
+import itertools
+import logging
 import os
+import re
+import uuid
+import warnings
+from collections.abc import AsyncIterator, Callable
+from contextlib import AbstractContextManager
 from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any
 
 import pytest
+import pytest_asyncio
+import vcr
+from aiohttp import web
+from aiohttp.test_utils import TestServer
 
 from mcp_folk.api_client import FolkAPIError, FolkClient
-
-# Skip all tests in this module if FOLK_API_KEY is not set
-pytestmark = pytest.mark.skipif(
-    not os.environ.get("FOLK_API_KEY"),
-    reason="FOLK_API_KEY environment variable not set",
+from mcp_folk.api_models import Group
+from mcp_folk.server import _find_group
+
+logger = logging.getLogger(__name__)
+
+CASSETTE_DIR = Path(__file__).parent / "cassettes" / Path(__file__).stem
+
+CassetteFactory = Callable[..., AbstractContextManager[Any]]
+
+pytestmark = [
+    # Share one event loop so the session-scoped client's connection pool stays usable
+    pytest.mark.asyncio(loop_scope="session"),
+]
+
+LIVE = pytest.param(
+    "live",
+    marks=[
+        pytest.mark.integration_live,
+        # Skip if there is nothing to record from or replay
+        pytest.mark.skipif(
+            not os.environ.get("FOLK_API_KEY") and not CASSETTE_DIR.is_dir(),
+            reason="FOLK_API_KEY environment variable not set and no recorded cassettes",
+        ),
+        pytest.mark.vcr,
+    ],
 )
+MOCKED = pytest.param("mocked", marks=pytest.mark.integration_mocked)
+
+MOCK_GROUPS = [
+    {"id": "grp_mock-clients", "name": "Clients"},
+    {"id": "grp_mock-influencers", "name": "Influencers"},
+]
+MOCK_PEOPLE = [
+    {
+        "id": "per_mock-ada",
+        "firstName": "Ada",
+        "lastName": "Lovelace",
+        "fullName": "Ada Lovelace",
+        "emails": ["ada@example.com"],
+        "groups": [MOCK_GROUPS[0]],
+        "customFieldValues": {"grp_mock-clients": {"Status": "Active"}},
+    },
+    {
+        "id": "per_mock-grace",
+        "firstName": "Grace",
+        "lastName": "Hopper",
+        "fullName": "Grace Hopper",
+        "emails": ["grace@example.com"],
+        "groups": [MOCK_GROUPS[0], MOCK_GROUPS[1]],
+        "customFieldValues": {"grp_mock-clients": {"Status": "Prospect"}},
+    },
+]
+MOCK_USER = {"id": "usr_mock-me", "fullName": "Test User", "email": "test@example.com"}
+# DTSTART with a TZID (or a UTC "Z" time), then an RRULE, as Folk expects
+RECURRENCE_RULE = re.compile(r"DTSTART(;TZID=[^:]+:\d{8}T\d{6}|:\d{8}T\d{6}Z)\nRRULE:FREQ=\w+.*")
+
+
+def mock_folk_app() -> web.Application:
+    """Stub the Folk endpoints these tests call, served in-process by aiohttp.
+
+    People filters on group membership and custom field values are applied, and
+    reminder bodies are checked the way the real API checks them, so the mocked
+    tests catch regressions in the filters and payloads the client sends.
+    """
+    reminder_seq = itertools.count()
+
+    def error(message: str) -> web.Response:
+        return web.json_response({"error": {"message": message}}, status=400)
+
+    def matches(person: dict[str, Any], key: str, value: str) -> bool:
+        if key == "filter[groups][in][id]":
+            return any(g["id"] == value for g in person["groups"])
+        field = re.fullmatch(r"filter\[customFieldValues\.([^.\]]+)\.([^\]]+)\]\[in\]", key)
+        if field is None:
+            raise ValueError(f"Unsupported filter: {key}")
+        group_id, name = field.groups()
+        return bool(person["customFieldValues"].get(group_id, {}).get(name) == value)
+
+    async def list_people(request: web.Request) -> web.Response:
+        filters = {k: v for k, v in request.query.items() if k.startswith("filter[")}
+        try:
+            people = [p for p in MOCK_PEOPLE if all(matches(p, k, v) for k, v in filters.items())]
+        except ValueError as e:
+            return error(str(e))
+        return web.json_response({"data": {"items": people}})
+
+    async def list_groups(request: web.Request) -> web.Response:
+        return web.json_response({"data": {"items": MOCK_GROUPS}})
+
+    async def current_user(request: web.Request) -> web.Response:
+        return web.json_response({"data": MOCK_USER})
+
+    async def create_reminder(request: web.Request) -> web.Response:
+        body = await request.json()
+        if not RECURRENCE_RULE.fullmatch(body.get("recurrenceRule", "")):
+            return error("recurrenceRule must be an iCalendar DTSTART with an RRULE")
+        if body.get("visibility") not in ("private", "public"):
+            return error("visibility must be private or public")
+        if body["visibility"] == "public" and not body.get("assignedUsers"):
+            return error("assignedUsers is required for public reminders")
+        reminder = {
+            "id": f"rmd_mock-{next(reminder_seq)}",
+            "name": body["name"],
+            "visibility": body["visibility"],
+            "assignedUsers": [MOCK_USER] if body.get("assignedUsers") else [],
+        }
+        return web.json_response({"data": reminder})
+
+    async def delete_reminder(request: web.Request) -> web.Response:
+        return web.Response(status=204)
+
+    app = web.Application()
+    app.router.add_get("/v1/people", list_people)
+    app.router.add_get("/v1/groups", list_groups)
+    app.router.add_get("/v1/users/me", current_user)
+    app.router.add_post("/v1/reminders", create_reminder)
+    app.router.add_delete("/v1/reminders/{reminder_id}", delete_reminder)
+    return app
+
+
+@pytest.fixture(scope="session", params=[LIVE, MOCKED])
+def backend(request: pytest.FixtureRequest) -> str:
+    """Which Folk API the tests talk to: "live" (or its cassettes) or "mocked"."""
+    return str(request.param)
+
+
+@pytest.fixture(scope="session")
+def vcr_config() -> dict[str, Any]:
+    """Keep the API key out of recorded cassettes."""
+    return {"filter_headers": [("authorization", "DUMMY")]}
+
+
+@pytest.fixture(scope="session")
+def record_mode(request: pytest.FixtureRequest) -> str:
+    """Record new cassettes only when a live API key is available.
+
+    Without FOLK_API_KEY, replay only, so a missing cassette fails loudly instead
+    of hitting the API unauthenticated. An explicit --record-mode always wins.
+    """
+    default = "once" if os.environ.get("FOLK_API_KEY") else "none"
+    return request.config.getoption("--record-mode") or default
 
 
-@pytest.fixture
-async def client() -> FolkClient:
-    """Create a Folk client for testing."""
-    return FolkClient()
-
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def client(backend: str) -> AsyncIterator[FolkClient]:
+    """Create a Folk client shared by every test in the session.
 
-@pytest.mark.asyncio
-class TestReminderIntegration:
-    """Integration tests for reminder functionality."""
+    Entering the client once keeps its HTTP session (and keep-alive connections)
+    open instead of reconnecting per test. Under pytest-xdist each worker process
+    runs its own session and therefore gets its own client. When replaying
+    cassettes the key is never sent, so a placeholder is used if none is set.
+    The mocked backend points the client at an in-process stub server instead.
+    """
+    if backend == "mocked":
+        async with TestServer(mock_folk_app()) as server:
+            base_url = str(server.make_url("/v1"))
+            async with FolkClient(api_key="test_key", base_url=base_url) as c:
+                yield c
+    else:
+        async with FolkClient(api_key=os.environ.get("FOLK_API_KEY") or "DUMMY") as c:
+            yield c
+
+
+@pytest.fixture(scope="session")
+def fixture_cassette(
+    request: pytest.FixtureRequest, backend: str, record_mode: str, vcr_config: dict[str, Any]
+) -> CassetteFactory:
+    """Cassette factory for requests made by module- and session-scoped fixtures.
+
+    Those fixtures are set up outside the per-test cassettes installed by
+    pytest.mark.vcr, so they record to cassettes of their own. The mocked
+    backend needs no cassettes.
+
+    These cassette names are shared, so under pytest-xdist every test in this
+    module must run on one worker (--dist=loadfile).
+    Otherwise each worker would record or replay the same fixture cassettes.
+    """
+    if backend == "mocked":
+        return lambda name, **kwargs: contextlib.nullcontext()
+    dist = request.config.getoption("dist", "no")
+    if os.environ.get("PYTEST_XDIST_WORKER") and dist != "loadfile":
+        pytest.fail(f"Live integration tests need --dist=loadfile under pytest-xdist, got {dist}")
+    recorder = vcr.VCR(
+        cassette_library_dir=str(CASSETTE_DIR), record_mode=record_mode, **vcr_config
+    )
+    return recorder.use_cassette
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="session")
+async def person_id(client: FolkClient, fixture_cassette: CassetteFactory) -> str:
+    """ID of a person to attach test reminders to, fetched once per module."""
+    with fixture_cassette("fixture.person_id.yaml"):
+        people = await client.list_people(limit=1)
+    if not people:
+        pytest.skip("No people in workspace to test with")
+    return people[0].id
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def all_groups(client: FolkClient, fixture_cassette: CassetteFactory) -> list[Group]:
+    """Workspace groups, fetched once per session.
+
+    Tests that want fewer groups slice this list; the API's ordering is kept.
+    """
+    with fixture_cassette("fixture.groups.yaml"):
+        return await client.list_groups(limit=100)
 
-    async def test_create_and_delete_reminder(self, client: FolkClient) -> None:
-        """Test creating and deleting a reminder against the real API."""
-        async with client:
-            # First, we need a person to attach the reminder to
-            # List existing people
-            people = await client.list_people(limit=1)
-            if not people:
-                pytest.skip("No people in workspace to test with")
 
-            person_id = people[0].id
+@pytest_asyncio.fixture(scope="module", loop_scope="session")
+async def reminder_ids(
+    client: FolkClient, fixture_cassette: CassetteFactory, record_mode: str
+) -> AsyncIterator[list[str]]:
+    """Collect IDs of reminders created by tests and delete them all at module teardown.
 
-            # Create a reminder for tomorrow
-            tomorrow = datetime.now(UTC) + timedelta(days=1)
-            tomorrow_9am = tomorrow.replace(hour=9, minute=0, second=0, microsecond=0)
-            trigger_time = tomorrow_9am.isoformat()
+    Cleanup runs even when a test fails after creating its reminder, and the
+    deletes are issued concurrently rather than one round-trip per test.
+    """
+    ids: list[str] = []
+    yield ids
+    # A test re-recorded on its own creates a reminder the existing cleanup cassette
+    # has never seen; "new_episodes" lets that DELETE reach the API instead of being
+    # blocked by "once" and leaving the reminder behind.
+    cleanup_mode = "new_episodes" if record_mode == "once" else record_mode
+    with fixture_cassette("fixture.reminder_cleanup.yaml", record_mode=cleanup_mode):
+        results = await asyncio.gather(
+            *(client.delete_reminder(i) for i in ids), return_exceptions=True
+        )
+    for reminder_id, result in zip(ids, results, strict=True):
+        if isinstance(result, BaseException):
+            warnings.warn(f"Failed to delete test reminder {reminder_id}: {result!r}", stacklevel=1)
+
+
+@pytest.fixture(scope="module")
+def tomorrow_9am_iso() -> str:
+    """Trigger time shared by the reminder tests: 09:00 UTC tomorrow, ISO 8601."""
+    tomorrow = datetime.now(UTC) + timedelta(days=1)
+    return tomorrow.replace(hour=9, minute=0, second=0, microsecond=0).isoformat()
+
+
+@pytest.fixture(scope="module")
+def recurrence_trigger_times() -> list[str]:
+    """Trigger times (09:00 UTC, ISO 8601) whose recurrenceRule the API must accept."""
+    # One "now" keeps the offsets consistent; timedelta(hours=24) would repeat days=1
+    now = datetime.now(UTC)
+    test_times = [now + timedelta(days=1), now + timedelta(days=7)]
+    return [t.replace(hour=9, minute=0, second=0, microsecond=0).isoformat() for t in test_times]
+
+
+def unique_name(prefix: str) -> str:
+    """Namespace a created object's name so parallel xdist workers don't collide."""
+    return f"{prefix} [{os.getpid()}-{uuid.uuid4().hex[:8]}]"
 
-            try:
-                reminder = await client.create_reminder(
-                    entity_id=person_id,
-                    name="Integration test reminder",
-                    trigger_time=trigger_time,
-                    visibility="private",  # Private doesn't require assignedUsers
-                )
 
-                assert reminder.id is not None
-                assert reminder.id.startswith("rmd_")
-                assert reminder.name == "Integration test reminder"
+class TestReminderIntegration:
+    """Integration tests for reminder functionality."""
 
-                # Clean up
-                deleted = await client.delete_reminder(reminder.id)
-                assert deleted is True
+    async def test_create_and_delete_reminder(
+        self,
+        client: FolkClient,
+        person_id: str,
+        reminder_ids: list[str],
+        tomorrow_9am_iso: str,
+    ) -> None:
+        """Test creating and deleting a reminder."""
+        name = unique_name("Integration test reminder")
+
+        try:
+            reminder = await client.create_reminder(
+                entity_id=person_id,
+                name=name,
+                trigger_time=tomorrow_9am_iso,
+                visibility="private",  # Private doesn't require assignedUsers
+            )
+            reminder_ids.append(reminder.id)
+
+            assert reminder.id is not None
+            assert reminder.id.startswith("rmd_")
+            # Replayed cassettes carry the recording run's suffix, so match the prefix
+            assert reminder.name.startswith("Integration test reminder")
+
+            # Deleting is what this test covers, so do it inline
+            deleted = await client.delete_reminder(reminder.id)
+            assert deleted is True
+            reminder_ids.remove(reminder.id)
+
+        except FolkAPIError as e:
+            pytest.fail(f"API error: {e.status} - {e.message} - {e.details}")
+
+    async def test_create_public_reminder(
+        self,
+        client: FolkClient,
+        person_id: str,
+        reminder_ids: list[str],
+        tomorrow_9am_iso: str,
+    ) -> None:
+        """Test creating a public reminder (requires assignedUsers)."""
+        try:
+            # Public reminder - client should auto-assign current user
+            reminder = await client.create_reminder(
+                entity_id=person_id,
+                name=unique_name("Public integration test reminder"),
+                trigger_time=tomorrow_9am_iso,
+                visibility="public",
+            )
+            reminder_ids.append(reminder.id)
 
-            except FolkAPIError as e:
-                pytest.fail(f"API error: {e.status} - {e.message} - {e.details}")
+            assert reminder.id is not None
+            assert reminder.visibility.value == "public"
 
-    async def test_create_public_reminder(self, client: FolkClient) -> None:
-        """Test creating a public reminder (requires assignedUsers)."""
-        async with client:
-            # Get a person
-            people = await client.list_people(limit=1)
-            if not people:
-                pytest.skip("No people in workspace to test with")
+        except FolkAPIError as e:
+            pytest.fail(f"API error: {e.status} - {e.message} - {e.details}")
 
-            person_id = people[0].id
+    async def test_reminder_recurrence_rule_format_accepted(
+        self,
+        client: FolkClient,
+        person_id: str,
+        reminder_ids: list[str],
+        recurrence_trigger_times: list[str],
+    ) -> None:
+        """Test that our recurrenceRule format is accepted by the API."""
 
-            # Create a reminder for tomorrow
-            tomorrow = datetime.now(UTC) + timedelta(days=1)
-            tomorrow_9am = tomorrow.replace(hour=9, minute=0, second=0, microsecond=0)
-            trigger_time = tomorrow_9am.isoformat()
+        async def _create(trigger_time: str) -> str:
+            trigger_date = datetime.fromisoformat(trigger_time).date()
 
             try:
-                # Public reminder - client should auto-assign current user
                 reminder = await client.create_reminder(
                     entity_id=person_id,
-                    name="Public integration test reminder",
+                    name=unique_name(f"Format test {trigger_date}"),
                     trigger_time=trigger_time,
-                    visibility="public",
+                    visibility="private",
                 )
+                reminder_ids.append(reminder.id)
 
                 assert reminder.id is not None
-                assert reminder.visibility.value == "public"
-
-                # Clean up
-                await client.delete_reminder(reminder.id)
+                return reminder.id
 
             except FolkAPIError as e:
-                pytest.fail(f"API error: {e.status} - {e.message} - {e.details}")
+                pytest.fail(
+                    f"API rejected format for {trigger_time}: "
+                    f"{e.status} - {e.message} - {e.details}"
+                )
+
+        # The reminders are independent, so create them concurrently
+        created = await asyncio.gather(*(_create(t) for t in recurrence_trigger_times))
+        assert len(set(created)) == len(recurrence_trigger_times)
+
 
-    async def test_reminder_recurrence_rule_format_accepted(self, client: FolkClient) -> None:
-        """Test that our recurrenceRule format is accepted by the API."""
-        async with client:
-            people = await client.list_people(limit=1)
-            if not people:
-                pytest.skip("No people in workspace to test with")
-
-            person_id = people[0].id
-
-            # Test various datetime formats
-            test_times = [
-                datetime.now(UTC) + timedelta(days=1),
-                datetime.now(UTC) + timedelta(days=7),
-                datetime.now(UTC) + timedelta(hours=24),
-            ]
-
-            for test_time in test_times:
-                test_time = test_time.replace(hour=9, minute=0, second=0, microsecond=0)
-                trigger_time = test_time.isoformat()
-
-                try:
-                    reminder = await client.create_reminder(
-                        entity_id=person_id,
-                        name=f"Format test {test_time.date()}",
-                        trigger_time=trigger_time,
-                        visibility="private",
-                    )
-
-                    assert reminder.id is not None
-                    await client.delete_reminder(reminder.id)
-
-                except FolkAPIError as e:
-                    pytest.fail(
-                        f"API rejected format for {trigger_time}: "
-                        f"{e.status} - {e.message} - {e.details}"
-                    )
-
-
-@pytest.mark.asyncio
 class TestGroupIntegration:
     """Integration tests for group and filtering functionality."""
 
-    async def test_list_groups(self, client: FolkClient) -> None:
+    async def test_list_groups(self, all_groups: list[Group]) -> None:
         """Test listing groups."""
-        async with client:
-            groups = await client.list_groups(limit=50)
-
-            # Should return a list (even if empty)
-            assert isinstance(groups, list)
-
-            if groups:
-                # Verify group structure
-                group = groups[0]
-                assert hasattr(group, "id")
-                assert hasattr(group, "name")
-                assert group.id.startswith("grp_")
-                print(f"\nFound {len(groups)} groups:")
+        groups = all_groups[:50]
+
+        # Should return a list (even if empty)
+        assert isinstance(groups, list)
+
+        if groups:
+            # Verify group structure
+            group = groups[0]
+            assert isinstance(group, Group)
+            assert group.id and group.name
+            assert group.id.startswith("grp_")
+            logger.debug("Found %d groups", len(groups))
+            if logger.isEnabledFor(logging.DEBUG):
                 for g in groups[:5]:
-                    print(f"  - {g.name} ({g.id})")
+                    logger.debug("  - %s (%s)", g.name, g.id)
 
-    async def test_filter_people_by_group(self, client: FolkClient) -> None:
+    async def test_filter_people_by_group(
+        self, client: FolkClient, all_groups: list[Group]
+    ) -> None:
         """Test filtering people by group membership."""
-        async with client:
-            # First get groups
-            groups = await client.list_groups(limit=10)
-            if not groups:
-                pytest.skip("No groups in workspace to test with")
+        groups = all_groups[:10]
+        if not groups:
+            pytest.skip("No groups in workspace to test with")
 
-            group = groups[0]
-            print(f"\nTesting with group: {group.name} ({group.id})")
+        group = groups[0]
+        logger.debug("Testing with group: %s (%s)", group.name, group.id)
 
-            # Filter people by group
-            filters = {"groups": {"in": {"id": group.id}}}
-            people = await client.list_people(limit=10, filters=filters)
+        # Filter people by group
+        filters = {"groups": {"in": {"id": group.id}}}
+        people = await client.list_people(limit=10, filters=filters)
 
-            print(f"Found {len(people)} people in group '{group.name}'")
+        logger.debug("Found %d people in group '%s'", len(people), group.name)
+        if logger.isEnabledFor(logging.DEBUG):
             for person in people[:3]:
-                print(f"  - {person.full_name or person.first_name}")
+                logger.debug("  - %s", person.full_name or person.first_name)
                 # Check if custom field values are returned
                 if person.custom_field_values:
                     group_fields = person.custom_field_values.get(group.id, {})
                     if group_fields:
-                        print(f"    Custom fields: {group_fields}")
+                        logger.debug("    Custom fields: %s", group_fields)
 
-    async def test_filter_people_by_custom_field(self, client: FolkClient) -> None:
+    async def test_filter_people_by_custom_field(
+        self, client: FolkClient, all_groups: list[Group]
+    ) -> None:
         """Test filtering people by custom field value (e.g., Status)."""
-        async with client:
-            # Get groups
-            groups = await client.list_groups(limit=10)
-            if not groups:
-                pytest.skip("No groups in workspace to test with")
-
-            # Try to find a group with people that have custom fields
-            for group in groups:
-                filters = {"groups": {"in": {"id": group.id}}}
-                people = await client.list_people(limit=5, filters=filters)
-
-                if people:
-                    # Check if any person has custom field values
-                    for person in people:
-                        group_fields = person.custom_field_values.get(group.id, {})
-                        if "Status" in group_fields and group_fields["Status"]:
-                            status_value = group_fields["Status"]
-                            print(
-                                f"\nFound person with Status='{status_value}' in group '{group.name}'"
-                            )
-
-                            # Now try to filter by that status
-                            status_filter = {
-                                "groups": {"in": {"id": group.id}},
-                                f"customFieldValues.{group.id}.Status": {"in": status_value},
-                            }
-                            filtered_people = await client.list_people(
-                                limit=10, filters=status_filter
-                            )
-                            print(
-                                f"Filter returned {len(filtered_people)} people with Status='{status_value}'"
-                            )
-
-                            # Verify they all have the expected status
-                            for p in filtered_people:
-                                p_status = p.custom_field_values.get(group.id, {}).get("Status")
-                                assert p_status == status_value, (
-                                    f"Expected {status_value}, got {p_status}"
-                                )
-
-                            return  # Test passed
-
-            pytest.skip("No groups with Status custom field found")
-
-
-@pytest.mark.asyncio
+        groups = all_groups[:10]
+        if not groups:
+            pytest.skip("No groups in workspace to test with")
+
+        # Fetch every group's members concurrently, then scan them in group order
+        member_lists = await asyncio.gather(
+            *(client.list_people(limit=5, filters={"groups": {"in": {"id": g.id}}}) for g in groups)
+        )
+
+        # Find the first person with a Status custom field value
+        for group, people in zip(groups, member_lists, strict=True):
+            for person in people:
+                status_value = person.custom_field_values.get(group.id, {}).get("Status")
+                if not status_value:
+                    continue
+
+                logger.debug(
+                    "Found person with Status='%s' in group '%s'", status_value, group.name
+                )
+
+                # Now try to filter by that status
+                status_filter = {
+                    "groups": {"in": {"id": group.id}},
+                    f"customFieldValues.{group.id}.Status": {"in": status_value},
+                }
+                filtered_people = await client.list_people(limit=10, filters=status_filter)
+                logger.debug(
+                    "Filter returned %d people with Status='%s'",
+                    len(filtered_people),
+                    status_value,
+                )
+
+                # Verify they all have the expected status
+                for p in filtered_people:
+                    p_status = p.custom_field_values.get(group.id, {}).get("Status")
+                    assert p_status == status_value, f"Expected {status_value}, got {p_status}"
+
+                return  # Test passed
+
+        pytest.skip("No groups with Status custom field found")
+
+
 class TestServerToolsIntegration:
     """Integration tests for MCP server tools.
 
@@ -237,105 +485,94 @@ class TestServerToolsIntegration:
     bypassing the FastMCP decorator which wraps them as FunctionTool objects.
     """
 
-    async def test_list_groups_tool(self, client: FolkClient) -> None:
+    async def test_list_groups_tool(self, all_groups: list[Group]) -> None:
         """Test the list_groups logic."""
-        async with client:
-            groups = await client.list_groups(limit=100)
-
-            result = {
-                "groups": [{"id": g.id, "name": g.name} for g in groups],
-                "total": len(groups),
-            }
-
-            assert "groups" in result
-            assert "total" in result
-            assert isinstance(result["groups"], list)
-            assert result["total"] == len(result["groups"])
-
-            if result["groups"]:
-                group = result["groups"][0]
-                assert "id" in group
-                assert "name" in group
-                print(f"\nlist_groups returned {result['total']} groups")
+        result = {
+            "groups": [{"id": g.id, "name": g.name} for g in all_groups],
+            "total": len(all_groups),
+        }
+
+        assert "groups" in result
+        assert "total" in result
+        assert isinstance(result["groups"], list)
+        assert result["total"] == len(result["groups"])
+
+        if result["groups"]:
+            group = result["groups"][0]
+            assert "id" in group
+            assert "name" in group
+            logger.debug("list_groups returned %d groups", result["total"])
+            if logger.isEnabledFor(logging.DEBUG):
                 for g in result["groups"][:3]:
-                    print(f"  - {g['name']}")
+                    logger.debug("  - %s", g["name"])
 
-    async def test_find_people_in_group_tool(self, client: FolkClient) -> None:
+    async def test_find_people_in_group_tool(
+        self, client: FolkClient, all_groups: list[Group]
+    ) -> None:
         """Test the find_people_in_group logic."""
-        async with client:
-            # Get groups
-            groups = await client.list_groups(limit=100)
-            if not groups:
-                pytest.skip("No groups available")
-
-            group = groups[0]
-            group_name = group.name
-            group_id = group.id
-            print(f"\nTesting find_people_in_group with group: {group_name}")
-
-            # Filter people by group (same logic as in server.py)
-            filters = {"groups": {"in": {"id": group_id}}}
-            people = await client.list_people(limit=20, filters=filters)
-
-            results = []
-            for person in people:
-                full_name_parts = []
-                if person.first_name:
-                    full_name_parts.append(person.first_name)
-                if person.last_name:
-                    full_name_parts.append(person.last_name)
-                full_name = " ".join(full_name_parts) or person.full_name or "Unknown"
-
-                group_custom_fields = person.custom_field_values.get(group_id, {})
-
-                results.append(
-                    {
-                        "id": person.id,
-                        "name": full_name,
-                        "email": person.emails[0] if person.emails else None,
-                        "status": group_custom_fields.get("Status"),
-                        "custom_fields": group_custom_fields,
-                    }
-                )
+        if not all_groups:
+            pytest.skip("No groups available")
+
+        group = all_groups[0]
+        group_name = group.name
+        group_id = group.id
+        logger.debug("Testing find_people_in_group with group: %s", group_name)
+
+        # Filter people by group (same logic as in server.py)
+        filters = {"groups": {"in": {"id": group_id}}}
+        people = await client.list_people(limit=20, filters=filters)
+
+        results = []
+        for person in people:
+            full_name_parts = []
+            if person.first_name:
+                full_name_parts.append(person.first_name)
+            if person.last_name:
+                full_name_parts.append(person.last_name)
+            full_name = " ".join(full_name_parts) or person.full_name or "Unknown"
+
+            group_custom_fields = person.custom_field_values.get(group_id, {})
+
+            results.append(
+                {
+                    "id": person.id,
+                    "name": full_name,
+                    "email": person.emails[0] if person.emails else None,
+                    "status": group_custom_fields.get("Status"),
+                    "custom_fields": group_custom_fields,
+                }
+            )
 
-            result = {
-                "found": len(results) > 0,
-                "people": results,
-                "total": len(results),
-                "group_name": group_name,
-            }
+        result = {
+            "found": len(results) > 0,
+            "people": results,
+            "total": len(results),
+            "group_name": group_name,
+        }
 
-            assert "found" in result
-            assert "people" in result
-            assert "total" in result
-            assert "group_name" in result
+        assert "found" in result
+        assert "people" in result
+        assert "total" in result
+        assert "group_name" in result
 
-            print(f"Found {result['total']} people in '{result['group_name']}'")
+        logger.debug("Found %d people in '%s'", result["total"], result["group_name"])
+        if logger.isEnabledFor(logging.DEBUG):
             for person in result["people"][:3]:
-                print(f"  - {person['name']} ({person.get('email', 'no email')})")
+                logger.debug("  - %s (%s)", person["name"], person.get("email", "no email"))
 
-    async def test_find_people_in_group_fuzzy_match(self, client: FolkClient) -> None:
+    async def test_find_people_in_group_fuzzy_match(self, all_groups: list[Group]) -> None:
         """Test that find_people_in_group handles fuzzy group name matching."""
-        async with client:
-            groups = await client.list_groups(limit=100)
-            if not groups:
-                pytest.skip("No groups available")
-
-            # Try partial/lowercase match (same logic as in server.py)
-            group_name = "influencers"  # lowercase
-            group = next(
-                (g for g in groups if g.name.lower() == group_name.lower()),
-                None,
-            )
-            if not group:
-                group = next(
-                    (g for g in groups if group_name.lower() in g.name.lower()),
-                    None,
-                )
-
-            if group:
-                print(f"\nFuzzy match: '{group_name}' -> '{group.name}'")
-                assert group.name.lower() == "influencers" or "influencers" in group.name.lower()
-            else:
-                print(f"\nNo fuzzy match for '{group_name}' in available groups")
-                print(f"Available: {[g.name for g in groups[:5]]}")
+        if not all_groups:
+            pytest.skip("No groups available")
+
+        # Try partial/lowercase match (the resolver find_people_in_group uses)
+        group_name = "influencers"  # lowercase
+        group = _find_group(all_groups, group_name)
+
+        if group:
+            logger.debug("Fuzzy match: '%s' -> '%s'", group_name, group.name)
+            assert group.name.lower() == "influencers" or "influencers" in group.name.lower()
+        else:
+            logger.debug("No fuzzy match for '%s' in available groups", group_name)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Available: %s", [g.name for g in all_groups[:5]])
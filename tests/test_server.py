@@ -0,0 +1,31 @@
+"""Tests for MCP server helpers."""
+
+from mcp_folk.api_models import Group
+from mcp_folk.server import _find_group
+
+
+class TestFindGroup:
+    """Tests for group name resolution used by the *_in_group tools."""
+
+    groups = [
+        Group(id="grp_1", name="Top Influencers"),
+        Group(id="grp_2", name="Influencers"),
+        Group(id="grp_3", name="influencers"),
+        Group(id="grp_4", name="Clients"),
+    ]
+
+    def test_exact_match_is_case_insensitive(self) -> None:
+        """Test that an exact match wins over an earlier substring match."""
+        group = _find_group(self.groups, "INFLUENCERS")
+        assert group is not None
+        assert group.id == "grp_2"  # First of the two exact matches
+
+    def test_falls_back_to_substring_match(self) -> None:
+        """Test that a partial name resolves to the first group containing it."""
+        group = _find_group(self.groups, "client")
+        assert group is not None
+        assert group.id == "grp_4"
+
+    def test_no_match(self) -> None:
+        """Test that an unknown name returns None."""
+        assert _find_group(self.groups, "Investors") is None